@@ -1,31 +1,58 @@
 from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.env import VirtualRunEnv
 
 class SDL3CppConan(ConanFile):
     name = "sdl3cpp"
     version = "0.1"
     settings = "os", "arch", "compiler", "build_type"
-    options = {"build_app": [True, False]}
+    options = {
+        "build_app": [True, False],
+        "with_physics": [True, False],
+        "with_video": [True, False],
+        "with_vulkan": [True, False],
+    }
     default_options = {
         "build_app": True,
+        "with_physics": True,
+        "with_video": True,
+        "with_vulkan": True,
         "lua/*:shared": False,
         "lua/*:fPIC": True,
         "lua/*:compile_as_cpp": False,
         "lua/*:with_tools": False,
     }
-    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+    generators = "CMakeDeps", "CMakeToolchain"
+    # Conan 2 generates VirtualRunEnv for consumers by default; generate() opts in.
+    virtualrunenv = False
+
+    def generate(self):
+        # conanrun scripts are only needed to launch the demo binary.
+        if self.options.build_app:
+            VirtualRunEnv(self).generate()
+
+    def validate(self):
+        # CMakeLists requires Vulkan whenever BUILD_SDL3_APP is on.
+        if self.options.build_app and not self.options.with_vulkan:
+            raise ConanInvalidConfiguration("build_app=True requires with_vulkan=True")
 
     def requirements(self):
+        # Needed by cube_script, which both sdl3_app and cube_script_tests build.
         self.requires("lua/5.4.8")
         self.requires("sdl/3.2.20")
-        self.requires("vulkan-loader/1.3.243.0")
-        self.requires("vulkan-headers/1.3.243.0")
-        self.requires("vulkan-memory-allocator/3.3.0")
-        self.requires("vulkan-validationlayers/1.3.243.0")
-        self.requires("ogg/1.3.5")
-        self.requires("theora/1.1.1")
-        self.requires("cli11/2.6.0")
         self.requires("bullet3/3.25")
-        self.requires("box2d/3.1.1")
         self.requires("assimp/6.0.2")
         self.requires("glm/1.0.1")
         self.requires("vorbis/1.3.7")
+        if self.options.build_app:
+            self.requires("cli11/2.6.0")
+        if self.options.with_vulkan:
+            self.requires("vulkan-loader/1.3.243.0")
+            self.requires("vulkan-headers/1.3.243.0")
+            self.requires("vulkan-memory-allocator/3.3.0")
+            self.requires("vulkan-validationlayers/1.3.243.0")
+        if self.options.with_video:
+            self.requires("ogg/1.3.5")
+            self.requires("theora/1.1.1")
+        if self.options.with_physics:
+            self.requires("box2d/3.1.1")
@@ -31,26 +31,64 @@ Use this script as a drop-in replacement for the original `dev_commands.py`.
 from __future__ import annotations
 
 import argparse
-import platform
-import subprocess
+import functools
+import os
+import re
+import sys
 from pathlib import Path
-from typing import Iterable, Sequence
 
-IS_WINDOWS = platform.system() == "Windows"
+# Annotations are only evaluated by type checkers, so skip importing `typing`
+# at runtime; mypy and pyright treat this constant like typing.TYPE_CHECKING.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+
+@functools.cache
+def _which(tool: str) -> str | None:
+    """`shutil.which` memoized per tool name, since PATH does not change."""
+    import shutil
+
+    return shutil.which(tool)
+
+
+# `sys.platform` is already loaded, unlike `platform`, which costs an import.
+IS_WINDOWS = sys.platform == "win32"
+
+# OS-dependent values resolved once at import rather than per command.
+EXE_SUFFIX = ".exe" if IS_WINDOWS else ""
+DEFAULT_EXE = "sdl3_app" + EXE_SUFFIX
+if IS_WINDOWS:
+    # Needed for printing every command, so there is nothing to defer here.
+    from subprocess import list2cmdline as _LIST2CMDLINE
+else:
+    _LIST2CMDLINE = None
 
 DEFAULT_GENERATOR = "ninja-msvc" if IS_WINDOWS else "ninja"
 GENERATOR_DEFAULT_DIR = {
     "vs": "build",
     "ninja": "build-ninja",
     "ninja-msvc": "build-ninja-msvc",
+    "ninja-mc": "build-ninja-mc",
 }
 CMAKE_GENERATOR = {
     "vs": "Visual Studio 17 2022",
     "ninja": "Ninja",
     "ninja-msvc": "Ninja",
+    "ninja-mc": "Ninja Multi-Config",
 }
+# Generators that pick the configuration at build time via `--config`.
+MULTI_CONFIG_GENERATORS = {"vs", "ninja-mc"}
 
 DEFAULT_BUILD_DIR = GENERATOR_DEFAULT_DIR[DEFAULT_GENERATOR]
+DEFAULT_PARALLEL = os.cpu_count() or 1
+DEFAULT_BIN = str(Path(DEFAULT_BUILD_DIR) / DEFAULT_EXE)
+
+# Fixed command prefixes, kept as argv tuples so they never pass through a shell.
+CONAN_DETECT = ("conan", "profile", "detect", "-f")
+CONAN_INSTALL = ("conan", "install", ".", "-of", "build", "-b", "missing")
+CONAN_LOCKFILE = "conan.lock"
+CONAN_LOCK_CREATE = ("conan", "lock", "create", ".", f"--lockfile-out={CONAN_LOCKFILE}")
 
 DEFAULT_VCVARSALL = (
     "C:\\Program Files\\Microsoft Visual Studio\\2022\\Professional"
@@ -58,17 +96,14 @@ DEFAULT_VCVARSALL = (
 )
 
 
+# Arguments made only of these ASCII characters are printed unquoted.
+_SHELL_SAFE = re.compile(r"[\w./:@=+-]+", re.ASCII).fullmatch
+
+
 def _sh_quote(s: str) -> str:
     """Minimal POSIX-style quoting for display purposes on non-Windows."""
-    if not s:
-        return "''"
-    safe = set(
-        "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        "._-/:@=+"
-    )
-    if all(c in safe for c in s):
-        return s
-    return "'" + s.replace("'", "'\"'\"'") + "'"
+    # An empty string falls through to the quoted branch and renders as ''.
+    return s if s and _SHELL_SAFE(s) else "'" + s.replace("'", "'\"'\"'") + "'"
 
 
 def _print_cmd(argv: Sequence[str]) -> None:
@@ -77,68 +112,145 @@ def _print_cmd(argv: Sequence[str]) -> None:
     command line. Uses Windows-specific quoting on Windows via
     `subprocess.list2cmdline`, and POSIX-style quoting elsewhere.
     """
-    if IS_WINDOWS:
-        rendered = subprocess.list2cmdline(list(argv))
+    if _LIST2CMDLINE is not None:
+        rendered = _LIST2CMDLINE(list(argv))
     else:
         rendered = " ".join(_sh_quote(a) for a in argv)
     print("\n> " + rendered)
 
 
-def run_argvs(argvs: Iterable[Sequence[str]], dry_run: bool) -> None:
+def run_argvs(
+    argvs: Iterable[Sequence[str]], dry_run: bool, quiet: bool = False
+) -> None:
     """
     Run a sequence of commands represented as lists of arguments. Each command
-    is printed before execution. If `dry_run` is True, commands are printed
-    but not executed.
+    is printed before execution unless `quiet` is True. If `dry_run` is True,
+    commands are always printed but not executed.
     """
+    if dry_run:
+        for argv in argvs:
+            _print_cmd(argv)
+        return
+    import subprocess
+
     for argv in argvs:
-        _print_cmd(argv)
-        if dry_run:
-            continue
+        if not quiet:
+            _print_cmd(argv)
         subprocess.run(list(argv), check=True)
 
 
+def _compiler_launcher() -> str | None:
+    """Return the compiler cache used as the C/C++ launcher, if installed."""
+    return _which("sccache") or _which("ccache")
+
+
+def _conan_default_profile() -> Path:
+    """Locate the profile `conan profile detect` writes, honoring CONAN_HOME."""
+    conan_home = os.environ.get("CONAN_HOME")
+    base = Path(conan_home).expanduser() if conan_home else Path.home() / ".conan2"
+    return base / "profiles" / "default"
+
+
 def _as_build_dir(path_str: str | None, fallback: str) -> str:
     """Return the provided path if not None, otherwise the fallback."""
     return path_str or fallback
 
 
 def dependencies(args: argparse.Namespace) -> None:
-    """Run Conan profile detection and install dependencies."""
-    cmd_detect = ["conan", "profile", "detect", "-f"]
-    cmd_install = ["conan", "install", ".", "-of", "build", "-b", "missing"]
+    """
+    Run Conan profile detection and install dependencies. Detection is
+    skipped when the default profile already exists unless `--force-detect`
+    is given.
+    """
+    argvs: list[list[str]] = []
+    if args.force_detect or not _conan_default_profile().exists():
+        argvs.append(list(CONAN_DETECT))
+    cmd_install = list(CONAN_INSTALL)
+    if Path(CONAN_LOCKFILE).exists():
+        # A pinned graph skips remote version resolution.
+        cmd_install.append(f"--lockfile={CONAN_LOCKFILE}")
+    if args.download_jobs:
+        cmd_install.extend(["-c", f"core.download:parallel={args.download_jobs}"])
     if args.conan_install_args:
         cmd_install.extend(args.conan_install_args)
-    run_argvs([cmd_detect, cmd_install], args.dry_run)
+    argvs.append(cmd_install)
+    run_argvs(argvs, args.dry_run, args.quiet)
+
+
+def lock(args: argparse.Namespace) -> None:
+    """Resolve the Conan graph once and pin it in `conan.lock`."""
+    cmd_lock = list(CONAN_LOCK_CREATE)
+    if args.conan_lock_args:
+        cmd_lock.extend(args.conan_lock_args)
+    run_argvs([cmd_lock], args.dry_run, args.quiet)
 
 
 def configure(args: argparse.Namespace) -> None:
-    """Configure a CMake project based on the chosen generator and options."""
-    generator = args.generator or DEFAULT_GENERATOR
-    build_dir = _as_build_dir(
-        args.build_dir, GENERATOR_DEFAULT_DIR.get(generator, "build")
-    )
-    cmake_args: list[str] = ["cmake", "-B", build_dir, "-S", "."]
-    if generator == "vs":
-        cmake_args.extend(["-G", CMAKE_GENERATOR["vs"]])
+    """
+    Configure a CMake project based on the chosen generator and options, or
+    from a `CMakePresets.json` preset when `--preset` is given.
+    """
+    if args.preset:
+        if args.generator or args.build_dir or args.build_type:
+            raise SystemExit(
+                "--preset cannot be combined with --generator, --build-dir or --build-type"
+            )
+        # The preset supplies the generator, build directory and build type.
+        cmake_args: list[str] = ["cmake", "--preset", args.preset]
     else:
-        cmake_args.extend(["-G", CMAKE_GENERATOR[generator]])
-        cmake_args.append(f"-DCMAKE_BUILD_TYPE={args.build_type}")
+        generator = args.generator or DEFAULT_GENERATOR
+        build_dir = _as_build_dir(
+            args.build_dir, GENERATOR_DEFAULT_DIR.get(generator, "build")
+        )
+        cmake_args = [
+            "cmake", "-B", build_dir, "-S", ".", "-G", CMAKE_GENERATOR[generator]
+        ]
+        if generator not in MULTI_CONFIG_GENERATORS:
+            # Multi-config generators switch Debug/Release via `build --config`
+            # without reconfiguring, so only single-config ones get a build type.
+            cmake_args.append(f"-DCMAKE_BUILD_TYPE={args.build_type or 'Release'}")
+    launcher = None if args.no_compiler_cache else _compiler_launcher()
+    if launcher:
+        cmake_args.extend(
+            [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+            ]
+        )
     if args.cmake_args:
         cmake_args.extend(args.cmake_args)
-    run_argvs([cmake_args], args.dry_run)
+    run_argvs([cmake_args], args.dry_run, args.quiet)
+
+
+def _build_argv(
+    build_dir: str,
+    config: str | None,
+    targets: Sequence[str],
+    parallel: int,
+    build_tool_args: Sequence[str] | None,
+) -> list[str]:
+    """Assemble a `cmake --build` command shared by `build` and `msvc-quick`."""
+    cmd: list[str] = ["cmake", "--build", build_dir]
+    if config:
+        cmd.extend(["--config", config])
+    if targets:
+        # A single invocation with several targets lets the build tool schedule
+        # them concurrently over one dependency graph.
+        cmd.extend(["--target", *targets])
+    if parallel:
+        cmd.extend(["--parallel", str(parallel)])
+    if build_tool_args:
+        cmd.append("--")
+        cmd.extend(build_tool_args)
+    return cmd
 
 
 def build(args: argparse.Namespace) -> None:
     """Run the `cmake --build` command for a given build directory."""
-    cmd: list[str] = ["cmake", "--build", args.build_dir]
-    if args.config:
-        cmd.extend(["--config", args.config])
-    if args.target:
-        cmd.extend(["--target", args.target])
-    if args.build_tool_args:
-        cmd.append("--")
-        cmd.extend(args.build_tool_args)
-    run_argvs([cmd], args.dry_run)
+    cmd = _build_argv(
+        args.build_dir, args.config, args.target, args.parallel, args.build_tool_args
+    )
+    run_argvs([cmd], args.dry_run, args.quiet)
 
 
 def _cmd_one_liner_vcvars_then(bat: str, arch: str, then_parts: Sequence[str]) -> list[str]:
@@ -155,7 +267,8 @@ def _cmd_one_liner_vcvars_then(bat: str, arch: str, then_parts: Sequence[str]) -
     command (`then_parts`) is converted to a command string using
     `subprocess.list2cmdline`, which properly quotes arguments for cmd.exe.
     """
-    then_cmdline = subprocess.list2cmdline(list(then_parts))
+    # Only reached on Windows, where `_LIST2CMDLINE` is bound at import.
+    then_cmdline = _LIST2CMDLINE(list(then_parts))
     full_cmd = f'call "{bat}" {arch} && {then_cmdline}'
     return ["cmd.exe", "/d", "/s", "/c", full_cmd]
 
@@ -182,31 +295,40 @@ def msvc_quick(args: argparse.Namespace) -> None:
         then_cmd = list(args.then_command)
     else:
         build_dir = _as_build_dir(args.build_dir, DEFAULT_BUILD_DIR)
-        then_cmd = ["cmake", "--build", build_dir]
-        if args.config:
-            then_cmd.extend(["--config", args.config])
-        if args.target:
-            then_cmd.extend(["--target", args.target])
-        if args.build_tool_args:
-            then_cmd.append("--")
-            then_cmd.extend(args.build_tool_args)
+        targets = [args.target] if args.target else []
+        then_cmd = _build_argv(
+            build_dir, args.config, targets, args.parallel, args.build_tool_args
+        )
     cmd = _cmd_one_liner_vcvars_then(bat, arch, then_cmd)
-    run_argvs([cmd], args.dry_run)
+    run_argvs([cmd], args.dry_run, args.quiet)
 
 
 def run_demo(args: argparse.Namespace) -> None:
     """
     Run a compiled demo application from the build directory. The default
     executable is `sdl3_app` (or `sdl3_app.exe` on Windows). Additional
-    arguments can be passed to the executable after `--`.
+    arguments can be passed to the executable after `--`. On POSIX the
+    executable replaces the current process via `os.execv`.
     """
-    build_dir = _as_build_dir(args.build_dir, DEFAULT_BUILD_DIR)
-    exe_name = args.target or ("sdl3_app.exe" if IS_WINDOWS else "sdl3_app")
-    binary = str(Path(build_dir) / exe_name)
-    cmd: list[str] = [binary]
-    if args.args:
-        cmd.extend(args.args)
-    run_argvs([cmd], args.dry_run)
+    if not args.build_dir and not args.target:
+        binary = DEFAULT_BIN
+    else:
+        build_dir = _as_build_dir(args.build_dir, DEFAULT_BUILD_DIR)
+        binary = str(Path(build_dir) / (args.target or DEFAULT_EXE))
+    forwarded = list(args.args or [])
+    if forwarded[:1] == ["--"]:
+        # argparse.REMAINDER keeps the separator; it is not meant for the binary.
+        forwarded = forwarded[1:]
+    cmd = [binary, *forwarded]
+    if args.dry_run or IS_WINDOWS:
+        run_argvs([cmd], args.dry_run, args.quiet)
+        return
+    # Running the demo is the last action, so on POSIX replace this Python
+    # process with it instead of keeping the interpreter alive as its parent.
+    if not args.quiet:
+        _print_cmd(cmd)
+        sys.stdout.flush()
+    os.execv(binary, cmd)
 
 
 def main() -> int:
@@ -216,8 +338,24 @@ def main() -> int:
         action="store_true",
         help="print commands without executing them",
     )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="do not echo commands before running them (ignored with --dry-run)",
+    )
     subparsers = parser.add_subparsers(dest="command", required=True)
     deps = subparsers.add_parser("dependencies", help="run Conan setup from README")
+    deps.add_argument(
+        "--download-jobs",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help="number of package binaries Conan downloads concurrently (0 keeps Conan's default)",
+    )
+    deps.add_argument(
+        "--force-detect",
+        action="store_true",
+        help="rerun `conan profile detect` even if the default profile exists",
+    )
     deps.add_argument(
         "--conan-install-args",
         nargs=argparse.REMAINDER,
@@ -227,19 +365,43 @@ def main() -> int:
         ),
     )
     deps.set_defaults(func=dependencies)
+    lockp = subparsers.add_parser(
+        "lock", help="pin the Conan graph in conan.lock for later `dependencies` runs"
+    )
+    lockp.add_argument(
+        "--conan-lock-args",
+        nargs=argparse.REMAINDER,
+        help=(
+            "extra arguments forwarded to `conan lock create` "
+            "(prefix with '--' before conan flags if needed)"
+        ),
+    )
+    lockp.set_defaults(func=lock)
     conf = subparsers.add_parser("configure", help="configure CMake project")
     conf.add_argument(
         "--generator",
-        choices=["vs", "ninja", "ninja-msvc"],
+        choices=list(CMAKE_GENERATOR),
         help=(
-            "which generator to invoke (default: Ninja+MSVC on Windows, Ninja elsewhere)"
+            "which generator to invoke (default: Ninja+MSVC on Windows, Ninja elsewhere; "
+            "ninja-mc selects Ninja Multi-Config)"
         ),
     )
     conf.add_argument("--build-dir", help="override the directory where CMake writes build files")
+    conf.add_argument(
+        "--preset",
+        help=(
+            "configure from a CMakePresets.json preset (ninja, ninja-msvc, ninja-mc, vs) "
+            "instead of --generator/--build-dir"
+        ),
+    )
     conf.add_argument(
         "--build-type",
-        default="Release",
-        help="single-config builds need an explicit CMAKE_BUILD_TYPE",
+        help="CMAKE_BUILD_TYPE for single-config generators (default: Release)",
+    )
+    conf.add_argument(
+        "--no-compiler-cache",
+        action="store_true",
+        help="do not use sccache/ccache as the compiler launcher even if installed",
     )
     conf.add_argument(
         "--cmake-args",
@@ -259,8 +421,15 @@ def main() -> int:
     )
     bld.add_argument(
         "--target",
-        default="sdl3_app",
-        help="target to build (e.g. sdl3_app, spinning_cube)",
+        nargs="+",
+        default=["sdl3_app"],
+        help="one or more targets to build in a single pass (e.g. sdl3_app cube_script_tests)",
+    )
+    bld.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help="number of concurrent build jobs (default: CPU count, 0 leaves it to the build tool)",
     )
     bld.add_argument(
         "--build-tool-args",
@@ -291,6 +460,12 @@ def main() -> int:
         default="sdl3_app",
         help="target to build (used by default follow-on build)",
     )
+    msvc.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL,
+        help="number of concurrent build jobs for the default follow-on build",
+    )
     msvc.add_argument(
         "--build-tool-args",
         nargs=argparse.REMAINDER,
@@ -326,6 +501,12 @@ def main() -> int:
     )
     runp.set_defaults(func=run_demo)
     args = parser.parse_args()
+    if args.dry_run:
+        args.func(args)
+        return 0
+    # Deferred so `--help` and `--dry-run` never load subprocess.
+    import subprocess
+
     try:
         args.func(args)
     except subprocess.CalledProcessError as exc:
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import argparse
+import gzip
+import io
 import json
 import logging
 import os
@@ -10,17 +13,27 @@ import platform
 import shutil
 import stat
 import tarfile
+import tempfile
+import time
 import zipfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 import urllib.error
 import urllib.request
 
 RELEASE_URL = "https://api.github.com/repos/nektos/act/releases/latest"
 USER_AGENT = "gh-actions-local-docker"
+COPY_BUFFER_SIZE = 1024 * 1024
+RELEASE_CACHE_TTL = 3600  # seconds before cached release metadata is revalidated
 
 logger = logging.getLogger(__name__)
 
+# The "data" extraction filter (Python 3.12; also 3.8.17, 3.9.17, 3.10.12 and
+# 3.11.4) rejects absolute paths, links out of the destination and special files.
+_TAR_EXTRACT_OPTIONS: dict[str, Any] = (
+    {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+)
+
 
 class ActBinaryError(SystemExit):
     """Raised when the requested `act` binary cannot be provided."""
@@ -87,39 +100,135 @@ def _select_asset(release: dict[str, Any]) -> dict[str, Any]:
     )
 
 
-def _fetch_latest_release() -> dict[str, Any]:
-    req = urllib.request.Request(
-        RELEASE_URL,
-        headers={"User-Agent": USER_AGENT},
-    )
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _load_cached_release(path: Path) -> dict[str, Any] | None:
+    try:
+        with path.open("rb") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def _fetch_latest_release(cache_root: Path) -> dict[str, Any]:
+    """Return the latest release metadata, served from cache while fresh."""
+    cache_path = cache_root / "latest.json"
+    etag_path = cache_root / "latest.etag"
+    cached = _load_cached_release(cache_path)
+    if cached is not None:
+        if time.time() - cache_path.stat().st_mtime < RELEASE_CACHE_TTL:
+            logger.debug("Using cached act release metadata %s", cache_path)
+            return cached
+
+    # The API honors gzip, which shrinks the release JSON several times over.
+    headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+    if cached is not None and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+    req = urllib.request.Request(RELEASE_URL, headers=headers)
     try:
         with urllib.request.urlopen(req, timeout=15) as resp:
             if resp.status != 200:
                 raise ActBinaryError(
                     "Unexpected response while fetching act release metadata."
                 )
-            return json.load(resp)
+            payload = resp.read()
+            if resp.headers.get("Content-Encoding") == "gzip":
+                payload = gzip.decompress(payload)
+            etag = resp.headers.get("ETag")
+    except urllib.error.HTTPError as exc:
+        if exc.code == 304 and cached is not None:
+            logger.debug("Act release metadata unchanged; refreshing %s", cache_path)
+            cache_path.touch()
+            return cached
+        raise ActBinaryError(f"Failed to download act release metadata: {exc}") from exc
     except urllib.error.URLError as exc:
         raise ActBinaryError(f"Failed to download act release metadata: {exc}") from exc
 
+    release = json.loads(payload)
+    _write_atomic(cache_path, payload)
+    if etag:
+        _write_atomic(etag_path, etag.encode("utf-8"))
+    else:
+        etag_path.unlink(missing_ok=True)
+    return release
+
 
 def _download_asset(url: str, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    """Download `url` to `dest`; the caller must have created `dest.parent`."""
     req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
     try:
+        # 1 MiB chunks instead of the 64 KiB default cut the number of syscalls.
         with urllib.request.urlopen(req, timeout=60) as resp, dest.open("wb") as out:
-            shutil.copyfileobj(resp, out)
+            shutil.copyfileobj(resp, out, length=COPY_BUFFER_SIZE)
     except urllib.error.URLError as exc:
         raise ActBinaryError(f"Failed to download act asset {url}: {exc}") from exc
 
 
-def _extract_archive(archive: Path, dest_dir: Path) -> None:
-    if archive.name.endswith(".zip"):
-        with zipfile.ZipFile(archive, "r") as zf:
-            zf.extractall(dest_dir)
-        return
-    with tarfile.open(archive, "r:gz") as tf:
-        tf.extractall(dest_dir)
+def _extract_zip_members(zf: zipfile.ZipFile, dest_dir: Path, members: set[str]) -> None:
+    for name in members:
+        try:
+            zf.extract(name, dest_dir)
+        except KeyError:
+            logger.debug("Archive has no member %s", name)
+
+
+def _extract_tar_members(tf: tarfile.TarFile, dest_dir: Path, members: set[str]) -> None:
+    # Works for streaming tarfiles: members are visited in archive order and the
+    # rest of the archive is left unread once every wanted member is out.
+    remaining = set(members)
+    for member in tf:
+        if member.name in remaining:
+            tf.extract(member, dest_dir, **_TAR_EXTRACT_OPTIONS)
+            remaining.discard(member.name)
+            if not remaining:
+                break
+
+
+def _extract_archive(archive: Path, dest_dir: Path, members: set[str]) -> None:
+    """Extract only `members` (archive-relative names) from a cached archive."""
+    try:
+        if archive.name.endswith(".zip"):
+            with zipfile.ZipFile(archive, "r") as zf:
+                _extract_zip_members(zf, dest_dir, members)
+            return
+        with tarfile.open(archive, "r:gz") as tf:
+            _extract_tar_members(tf, dest_dir, members)
+    except (tarfile.TarError, zipfile.BadZipFile, OSError) as exc:
+        raise ActBinaryError(f"Failed to extract act asset {archive}: {exc}") from exc
+
+
+def _download_and_extract(
+    url: str, dest_dir: Path, is_zip: bool, members: set[str]
+) -> None:
+    """
+    Extract `members` straight from the HTTP response, without a temp archive.
+    A truncated or corrupt stream can leave partial files in `dest_dir`.
+    """
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            if is_zip:
+                # Zip readers need to seek to the central directory at the end.
+                with zipfile.ZipFile(io.BytesIO(resp.read()), "r") as zf:
+                    _extract_zip_members(zf, dest_dir, members)
+                return
+            # Streaming mode reads the gzip'd tar sequentially, no seeking.
+            with tarfile.open(fileobj=resp, mode="r|gz") as tf:
+                _extract_tar_members(tf, dest_dir, members)
+    except urllib.error.URLError as exc:
+        raise ActBinaryError(f"Failed to download act asset {url}: {exc}") from exc
+    except (tarfile.TarError, zipfile.BadZipFile, OSError) as exc:
+        raise ActBinaryError(f"Failed to extract act asset {url}: {exc}") from exc
 
 
 def _binary_name_for_asset(asset_name: str) -> str:
@@ -133,8 +242,51 @@ def _set_executable(path: Path) -> None:
     path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
 
 
-def ensure_act_binary(act_path: Path | None = None) -> Path:
-    """Resolve the act binary, downloading it into the cache if necessary."""
+def _install_binary(
+    extract: Callable[[Path], None], release_dir: Path, binary_name: str
+) -> None:
+    """
+    Run `extract` into a scratch directory inside `release_dir` and move the
+    binary into place only once it finished cleanly, so an interrupted
+    extraction never leaves a partial binary for later runs to trust.
+    """
+    staging = Path(tempfile.mkdtemp(dir=release_dir, prefix=".extract-"))
+    try:
+        extract(staging)
+        staged = staging / binary_name
+        if not staged.exists():
+            raise ActBinaryError("act binary missing after extracting release asset")
+        _set_executable(staged)
+        os.replace(staged, release_dir / binary_name)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _cached_asset_is_complete(asset_path: Path, expected_size: Any) -> bool:
+    """Check a cached archive against the size GitHub reports for the asset."""
+    try:
+        actual_size = asset_path.stat().st_size
+    except FileNotFoundError:
+        return False
+    if isinstance(expected_size, int) and actual_size != expected_size:
+        logger.warning(
+            "Discarding incomplete act asset %s (%d of %d bytes)",
+            asset_path,
+            actual_size,
+            expected_size,
+        )
+        asset_path.unlink()
+        return False
+    return True
+
+
+def ensure_act_binary(act_path: Path | None = None, keep_archive: bool = False) -> Path:
+    """
+    Resolve the act binary, downloading it into the cache if necessary.
+
+    The release asset is extracted while it downloads; pass `keep_archive` to
+    also store the archive itself in the cache.
+    """
 
     if act_path:
         resolved = act_path.expanduser().resolve()
@@ -143,9 +295,9 @@ def ensure_act_binary(act_path: Path | None = None) -> Path:
         logger.info("Using act binary from %s", resolved)
         return resolved
 
-    release = _fetch_latest_release()
-    asset = _select_asset(release)
     cache_root = _default_cache_root()
+    release = _fetch_latest_release(cache_root)
+    asset = _select_asset(release)
     release_tag = release.get("tag_name", "latest")
     release_dir = cache_root / release_tag
     release_dir.mkdir(parents=True, exist_ok=True)
@@ -158,25 +310,58 @@ def ensure_act_binary(act_path: Path | None = None) -> Path:
     if binary_path.exists():
         logger.info("Using cached act binary at %s", binary_path)
         return binary_path
-    if not asset_path.exists():
+    expected_size = asset.get("size")
+    have_archive = _cached_asset_is_complete(asset_path, expected_size)
+    if have_archive:
+        logger.debug("Reusing previously downloaded asset %s", asset_path)
+    elif keep_archive:
         logger.info("Downloading act asset %s", asset["browser_download_url"])
         _download_asset(asset["browser_download_url"], asset_path)
+        if not _cached_asset_is_complete(asset_path, expected_size):
+            raise ActBinaryError(f"Downloaded act asset {asset_path} is incomplete")
         logger.info("Downloaded act asset %s", asset_path)
+        have_archive = True
+    if have_archive:
+        logger.info("Extracting act asset %s", asset_path)
+        try:
+            _install_binary(
+                lambda dest: _extract_archive(asset_path, dest, {binary_name}),
+                release_dir,
+                binary_name,
+            )
+        except ActBinaryError:
+            # The size matched but the archive is unusable; fetch it afresh next time.
+            asset_path.unlink(missing_ok=True)
+            raise
     else:
-        logger.debug("Reusing previously downloaded asset %s", asset_path)
-    logger.info("Extracting act asset %s", asset_path)
-    _extract_archive(asset_path, release_dir)
-    if not binary_path.exists():
-        raise ActBinaryError("act binary missing after extracting release asset")
-    _set_executable(binary_path)
+        logger.info(
+            "Downloading and extracting act asset %s", asset["browser_download_url"]
+        )
+        _install_binary(
+            lambda dest: _download_and_extract(
+                asset["browser_download_url"],
+                dest,
+                asset_name.endswith(".zip"),
+                {binary_name},
+            ),
+            release_dir,
+            binary_name,
+        )
     logger.info("Act binary ready at %s", binary_path)
     return binary_path
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--keep-archive",
+        action="store_true",
+        help="also keep the downloaded release archive in the cache",
+    )
+    args = parser.parse_args(argv)
     logging.basicConfig(level=logging.INFO)
     try:
-        path = ensure_act_binary()
+        path = ensure_act_binary(keep_archive=args.keep_archive)
     except ActBinaryError as exc:
         raise SystemExit(exc)
     print(path)
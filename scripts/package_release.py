@@ -1,8 +1,20 @@
 #!/usr/bin/env python3
 import os
 import shutil
+import zipfile
 from pathlib import Path
 
+
+def link_or_copy(src, dst):
+    # Hardlink instead of copying bytes the archive step only reads back;
+    # fall back to a real copy across filesystems or where links are refused.
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+
 root = Path.cwd()
 release_dir = root / "release"
 package_dir = release_dir / "package"
@@ -17,20 +29,25 @@ if platform_name == "windows":
     binary_source = build_dir / "Release" / binary_name
 else:
     binary_source = build_dir / binary_name
-if not binary_source.exists():
+try:
+    link_or_copy(binary_source, package_dir / binary_name)
+except FileNotFoundError:
     raise SystemExit(f"Missing binary at {binary_source}")
-shutil.copy2(binary_source, package_dir / binary_name)
 
 for subdir in ("shaders", "scripts"):
     src = build_dir / subdir
     target = package_dir / subdir
     if not src.exists():
         raise SystemExit(f"Missing {subdir} directory at {src}")
-    shutil.copytree(src, target)
+    shutil.copytree(src, target, copy_function=link_or_copy)
 
-shutil.copy2(root / "README.md", package_dir / "README.md")
+link_or_copy(root / "README.md", package_dir / "README.md")
 
 zip_name = os.environ["ZIP_NAME"]
 archive_path = release_dir / zip_name
-shutil.make_archive(str(archive_path.with_suffix("")), "zip", root_dir=package_dir)
+with zipfile.ZipFile(
+    archive_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6
+) as zf:
+    for path in sorted(package_dir.rglob("*")):
+        zf.write(path, path.relative_to(package_dir))
 print(f"Created {archive_path}")
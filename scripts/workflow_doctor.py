@@ -10,9 +10,11 @@ security and correctness concerns.
 from __future__ import annotations
 
 import argparse
+import os
 import pathlib
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Iterable, List, Tuple, Union
 
 try:
@@ -23,8 +25,21 @@ except ImportError:  # pragma: no cover - defensive
     )
     sys.exit(2)
 
+try:
+    # The libyaml-backed loader parses an order of magnitude faster.
+    from yaml import CSafeLoader as _YamlLoader  # type: ignore
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 PathLike = Union[str, pathlib.Path]
 
+_VERSION_TAG_RE = re.compile(r"v?\d+(\.\d+)*")
+_COMMIT_SHA_RE = re.compile(r"[0-9a-fA-F]{7,40}")
+
+# Each worker must get at least this many workflows before a process pool is
+# used: parsing one file takes ~0.3 ms while spawning a worker takes ~80 ms.
+MIN_FILES_PER_WORKER = 256
+
 
 class WorkflowReport:
     def __init__(self, path: pathlib.Path) -> None:
@@ -60,12 +75,19 @@ def find_workflows(directory: PathLike) -> List[pathlib.Path]:
     base = pathlib.Path(directory)
     if not base.exists():
         raise FileNotFoundError(f"Workflow directory not found: {base}")
-    return sorted(base.glob("*.yml")) + sorted(base.glob("*.yaml"))
+    # One directory pass instead of a glob per extension.
+    with os.scandir(base) as entries:
+        paths = [
+            pathlib.Path(entry.path)
+            for entry in entries
+            if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+        ]
+    return sorted(paths)
 
 
 def load_yaml_file(path: pathlib.Path) -> Dict:
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+        return yaml.load(handle, Loader=_YamlLoader) or {}
 
 
 def collect_triggers(raw_on: Union[Dict, List, str, None]) -> List[str]:
@@ -84,10 +106,10 @@ def classify_action_reference(ref: str) -> str:
     _, version = ref.split("@", 1)
     if version.lower() in {"main", "master", "latest", "edge"}:
         return "floating-branch"
-    if re.fullmatch(r"v?\d+(\.\d+)*", version):
+    if _VERSION_TAG_RE.fullmatch(version):
         # Major/minor tags are better than branches but still float.
         return "floating-tag"
-    if re.fullmatch(r"[0-9a-fA-F]{7,40}", version):
+    if _COMMIT_SHA_RE.fullmatch(version):
         return "pinned-sha"
     return "tagged"
 
@@ -96,12 +118,14 @@ def iter_uses_statements(obj: Dict) -> Iterable[Tuple[str, str]]:
     """Yield (location, uses value) pairs for jobs and steps."""
     jobs = obj.get("jobs", {})
     for job_name, job in jobs.items():
+        job_location = f"job `{job_name}`"
         if isinstance(job, dict) and "uses" in job:
-            yield (f"job `{job_name}`", str(job["uses"]))
+            yield (job_location, str(job["uses"]))
         for step in job.get("steps", []) or []:
-            if isinstance(step, dict) and "uses" in step:
-                name = step.get("name") or step.get("id") or "unnamed step"
-                yield (f"step `{name}` in job `{job_name}`", str(step["uses"]))
+            if not isinstance(step, dict) or "uses" not in step:
+                continue
+            name = step.get("name") or step.get("id") or "unnamed step"
+            yield (f"step `{name}` in {job_location}", str(step["uses"]))
 
 
 def check_permissions(report: WorkflowReport, workflow: Dict) -> None:
@@ -167,6 +191,12 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         type=pathlib.Path,
         help="Directory containing workflow YAML files",
     )
+    parser.add_argument(
+        "--jobs",
+        default=1,
+        type=int,
+        help="Worker processes for large workflow sets (0 = one per CPU)",
+    )
     return parser.parse_args(argv)
 
 
@@ -182,7 +212,15 @@ def main(argv: List[str] | None = None) -> int:
         print(f"No workflows found in {args.workflows_dir}")
         return 0
 
-    reports = [analyze_workflow(path) for path in workflow_paths]
+    jobs = args.jobs or os.cpu_count() or 1
+    workers = min(jobs, len(workflow_paths) // MIN_FILES_PER_WORKER)
+    if workers < 2:
+        reports = [analyze_workflow(path) for path in workflow_paths]
+    else:
+        # One chunk per worker; map keeps the reports in path order.
+        chunksize = -(-len(workflow_paths) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            reports = list(executor.map(analyze_workflow, workflow_paths, chunksize=chunksize))
     for report in reports:
         print(report.render())
         print()